@@ -2,6 +2,8 @@ from _blackjack import Blackjack
 from _card import Card
 from _deck import Deck
 from _hand import Hand
+from _simulation import simulate_rounds
+from _strategy import basic_strategy, choose_action
 
 if __name__ == '__main__':
     game = Blackjack()
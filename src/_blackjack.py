@@ -1,6 +1,6 @@
 from IPython.display import clear_output
 from time import sleep
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 from _card import Card
 from _deck import Deck
@@ -12,7 +12,7 @@ class Blackjack:
     The Blackjack class, which represents the various aspects of the game
     """
 
-    def __init__(self, starting_money: int = 1000, h17: bool = True, can_dd_after_split: bool = True, max_splits: Optional[int] = 3, natural_after_split: bool = True, can_split_diff_tens: bool = True, one_hit_ace_split: bool = True, num_decks: int = 6, use_stop_card: bool = True, min_bet: int = 2, max_bet: Optional[int] = 500) -> None:
+    def __init__(self, starting_money: int = 1000, h17: bool = True, can_dd_after_split: bool = True, max_splits: Optional[int] = 3, natural_after_split: bool = True, can_split_diff_tens: bool = True, one_hit_ace_split: bool = True, num_decks: int = 6, use_stop_card: bool = True, min_bet: int = 2, max_bet: Optional[int] = 500, fast_mode: bool = False) -> None:
         """
         :param starting_money: The amount of money the player starts with
         :param h17: Whether the house hits on soft 17
@@ -25,6 +25,7 @@ class Blackjack:
         :param use_stop_card: Whether the deck should have a card placed near the bottom to prevent card counting (Must use at least 2 decks)
         :param min_bet: The minimum bet the player must place on a hand
         :param max_bet: The maximum bet the player can place on a hand (None for unlimited)
+        :param fast_mode: Whether to skip clearing the screen and pausing between cards (for automated play)
         """
 
         if not (starting_money >= 1):
@@ -57,26 +58,36 @@ class Blackjack:
         self._can_split_diff_tens: bool = can_split_diff_tens
         self._one_hit_ace_split: bool = one_hit_ace_split
         self._deck: Deck = Deck(num_decks=num_decks,
-                                use_stop_card=use_stop_card)
+                                use_stop_card=use_stop_card, fast_mode=fast_mode)
         self._min_bet: int = min_bet
         self._max_bet: Optional[int] = max_bet
+        self._fast_mode: bool = fast_mode
 
         self._rounds_played: int = 0  # counter for total number of rounds player has played
 
+        # reused every round instead of being remade
+        self._player_hands: List[Hand] = []
+        self._bets: List[int] = []
+        self._bets_total: int = 0  # kept up to date with the bets instead of summing them
+        self._results: List[Optional[int]] = []
+
     def _refresh_output(self) -> None:
         """
         Clears the output and prints header information
         """
 
-        clear_output(wait=True)  # clear the screen
+        if not self.fast_mode:
+            clear_output(wait=True)  # clear the screen
 
         # print round and money left
         print(f'Round {self.rounds_played + 1}')
         print(f'${self.money_left} left', end='\n\n')
 
-    def _start_round(self) -> None:
+    def _start_round(self, num_hands: Optional[int] = None) -> None:
         """
         Sets up the player's hand(s) and the house's hand
+
+        :param num_hands: The number of hands to play, or None to ask the player
         """
 
         if not (self.money_left >= self.min_bet):
@@ -85,12 +96,17 @@ class Blackjack:
 
         self._refresh_output()  # clear screen and redisplay header info
 
-        if self.money_left >= self.min_bet * 2:  # player has enough money for more than one hand
-            # maximum number of hands player can afford
-            max_hands: int = min(self.money_left//self.min_bet, 7)
-            # number of hands player wants to play this round
-            num_starting_hands: int = int(
-                input(f'How many hands? (1 -> {max_hands}): '))
+        # number of hands was given or player has enough money for more than one hand
+        if num_hands is not None or self.money_left >= self.min_bet * 2:
+            if num_hands is not None:
+                num_starting_hands: int = num_hands  # number of hands was already chosen
+
+            else:
+                # maximum number of hands player can afford
+                max_hands: int = min(self.money_left//self.min_bet, 7)
+                # number of hands player wants to play this round
+                num_starting_hands: int = int(
+                    input(f'How many hands? (1 -> {max_hands}): '))
 
             if not (1 <= num_starting_hands <= 7):
                 raise ValueError(
@@ -105,37 +121,42 @@ class Blackjack:
         else:
             num_starting_hands = 1  # only enough money for one hand
 
-        self._player_hands: List[Hand] = [Hand() for _ in range(
-            num_starting_hands)]  # create player's hands
+        self._player_hands.clear()
+        self._player_hands.extend(Hand() for _ in range(
+            num_starting_hands))  # create player's hands
         self._house_hand: List[Hand] = Hand()  # create house hand
 
-    def _collect_bets(self) -> None:
+    def _collect_bets(self, starting_bet: Optional[int] = None) -> None:
         """
         Gathers bets for each player hand
+
+        :param starting_bet: The bet to place on every hand, or None to ask the player
         """
 
-        self._bets: List[int] = []
+        self._bets.clear()
+        self._bets_total: int = 0
 
         for i in range(self.num_player_hands):  # iterate through player hands
             self._refresh_output()  # clear screen and redisplay header info
 
             # max possible bet takes into account previous bets
-            max_bet: int = min(self.money_left - sum(self._bets),
+            max_bet: int = min(self.money_left - self._bets_total,
                                self.max_bet if self.max_bet is not None else float('inf'))
             # how much player bets on current hand
-            bet: int = int(
+            bet: int = starting_bet if starting_bet is not None else int(
                 input(f'<Hand {i + 1}> Bet (${self.min_bet} -> ${max_bet}): '))
 
             # bet must be at least minimum and at most maximum or the money available
             if not (bet >= self.min_bet):
                 raise ValueError(
-                    f'bet must be at least the minimum bet, got {self.bet} < {self.min_bet}')
+                    f'bet must be at least the minimum bet, got {bet} < {self.min_bet}')
 
             if not (bet <= max_bet):
                 raise ValueError(
                     f'bet must be at at most the least of either the money left or maximum bet, got {bet} > {max_bet}')
 
             self._bets.append(bet)  # remember bet
+            self._bets_total += bet
 
         print()
 
@@ -146,14 +167,17 @@ class Blackjack:
 
         self._refresh_output()  # clear screen and redisplay header info
 
-        for i in range(len(self._player_hands)):
-            print(
-                f'<Hand {i + 1}> ({self._player_hands[i].display_score}): {self._player_hands[i]} -> ${self._bets[i]}')  # info for player hand, i.e. <Hand 1> (12): [2♠, 10♠] -> $10
+        lines: List[str] = [f'<Hand {i + 1}> ({hand.display_score}): {hand} -> ${bet}' for i, (hand, bet) in enumerate(
+            zip(self._player_hands, self._bets))]  # info for player hands, i.e. <Hand 1> (12): [2♠, 10♠] -> $10
 
-        print()
-        print(
-            f'<House> ({self._house_hand.display_score}): {self._house_hand}', end='\n\n')  # info for house hand, i.e. <House> (8+): [8♠, 🂠]
-        sleep(0.5)
+        lines.append('')
+        lines.append(
+            f'<House> ({self._house_hand.display_score}): {self._house_hand}')  # info for house hand, i.e. <House> (8+): [8♠, 🂠]
+
+        print('\n'.join(lines), end='\n\n')  # show every hand at once
+
+        if not self.fast_mode:
+            sleep(0.5)
 
     def _deal(self) -> None:
         """
@@ -167,77 +191,69 @@ class Blackjack:
 
             self.deck.insert_reached = False  # new stop card
 
-        self._show_hands()
-
-        # player's first card(s)
-        for i in range(len(self._player_hands)):
-            card: Card = self._deck.draw_card()
-
-            self._player_hands[i].add(card)
-
-            self._show_hands()
-
-        # house's first card (face down)
-        card: Card = self._deck.draw_card(face_down=True)
-
-        self._house_hand.add(card)
-
-        self._show_hands()
-
-        # player's second card(s)
-        for i in range(len(self._player_hands)):
-            card: Card = self._deck.draw_card()
-
-            self._player_hands[i].add(card)
-
-            self._show_hands()
-
-        # house's second card
-        card: Card = self._deck.draw_card()
+        # player's cards, two per hand
+        for hand in self._player_hands:
+            hand.add(self._deck.draw_card())
+            hand.add(self._deck.draw_card())
 
-        self._house_hand.add(card, front=True)
+        # house's cards, the first card is face down (second in the hand)
+        self._house_hand.add(self._deck.draw_card(), face_down=True)
+        self._house_hand.add(self._deck.draw_card(), front=True)
 
-        self._show_hands()
+        self._show_hands()  # show the whole deal at once
 
     def _check_naturals(self) -> None:
         """
         Checks if the player and/or house has a natural (21 with two cards)
         """
 
-        self._results: List[Optional[int]] = [
-            None] * self.num_player_hands  # store money results of player's hands
+        self._results.clear()
+        # store money results of player's hands
+        self._results.extend([None] * self.num_player_hands)
+
+        house_natural: bool = self._house_hand.is_21
 
         # house natural
-        if self._house_hand.is_21:
-            self._house_hand[1].flip()
+        if house_natural:
+            self._house_hand.flip(1)
 
             self._show_hands()
 
             print(f'<House> has a natural', end='\n\n')
 
         for i in range(len(self._player_hands)):
+            player_natural: bool = self._player_hands[i].is_21
+
             # player natural and no house natural: 1.5x win
-            if self._player_hands[i].is_21 and not self._house_hand.is_21:
+            if player_natural and not house_natural:
                 print(f'<Hand {i + 1}> has a natural', end='\n\n')
 
-                self._results[i] = int(
-                    round(self._bets[i] * 1.5))
+                self._results[i] = self._bets[i] * 3 // 2
 
             # house natural and no player natural: lose
-            elif self._house_hand.is_21 and not self._player_hands[i].is_21:
+            elif house_natural and not player_natural:
                 self._results[i] = -self._bets[i]
 
             # player natural and house natural: win
-            elif self._player_hands[i].is_21 and self._house_hand.is_21:
+            elif player_natural and house_natural:
                 print(f'<Hand {i + 1}> has a natural', end='\n\n')
 
                 self._results[i] = 0
 
-    def _player_turn(self) -> None:
+    def _player_turn(self, policy: Optional[Callable[[Hand, Card, List[str]], str]] = None) -> None:
         """
         Performs actions for player's hand(s) and deals extra cards if necessary
+
+        :param policy: Chooses an action given the hand, the house's face-up card and the possible choices, or None to ask the player
         """
 
+        # house rules don't change during the turn
+        one_hit_ace_split: bool = self._one_hit_ace_split
+        can_dd_after_split: bool = self._can_dd_after_split
+        can_split_diff_tens: bool = self._can_split_diff_tens
+        max_splits: Optional[int] = self._max_splits
+        natural_after_split: bool = self._natural_after_split
+
         i: int = 0
 
         while i < len(self._player_hands):
@@ -247,11 +263,13 @@ class Blackjack:
 
                 continue
 
+            hand: Hand = self._player_hands[i]
+
             while True:
                 actions: List[str] = ['Hit', 'Stand']
                 choices: List[str] = ['h', 's']
 
-                if self.one_hit_ace_split and self._player_hands[i].times_split == 1 and self._player_hands[i][0] == 1:
+                if one_hit_ace_split and hand.times_split == 1 and hand[0] == 1:
                     choice: str = 'h'  # player has to hit after splitting aces
 
                     one_hit_ace: bool = True  # player cannot play the hand anymore
@@ -260,17 +278,26 @@ class Blackjack:
                     one_hit_ace: bool = False
 
                     # player has enough money to redo bet
-                    if self.money_left - sum(self._bets) >= self._bets[i] and (self.can_dd_after_split or self._player_hands[i].times_split == 0):
+                    can_redo_bet: bool = self._money_left - \
+                        self._bets_total >= self._bets[i]
+
+                    # house rules allow player to double down
+                    if can_redo_bet and (can_dd_after_split or hand.times_split == 0):
                         actions.append('Double Down')
                         choices.append('dd')
 
-                    # house rules allow player to split cards and player has enough money to redo bet
-                    if (self._player_hands[i].can_split if self.can_split_diff_tens else self._player_hands[i].can_split_same) and (self.max_splits is None or self._player_hands[i].times_split < self.max_splits) and self.money_left - sum(self._bets) >= self._bets[i]:
+                    # house rules allow player to split cards
+                    if (hand.can_split if can_split_diff_tens else hand.can_split_same) and (max_splits is None or hand.times_split < max_splits) and can_redo_bet:
                         actions.append('Split')
                         choices.append('sp')
 
-                    choice: str = input(
-                        f'<Hand {i + 1}> ({self._player_hands[i].display_score}): {"? ".join(actions)} ({"/".join(choices)}): ').lower()  # get player action, i.e. <Hand 1> (12): Hit? Stand? Double Down? (h/s/dd):
+                    if policy is not None:
+                        choice: str = policy(
+                            hand, self._house_hand[0], choices)
+
+                    else:
+                        choice: str = input(
+                            f'<Hand {i + 1}> ({hand.display_score}): {"? ".join(actions)} ({"/".join(choices)}): ').lower()  # get player action, i.e. <Hand 1> (12): Hit? Stand? Double Down? (h/s/dd):
 
                     if choice not in choices:
                         raise ValueError(
@@ -284,15 +311,17 @@ class Blackjack:
                     break
 
                 elif choice == 'dd':  # double down
+                    self._bets_total += self._bets[i]
                     self._bets[i] *= 2
 
                 elif choice == 'sp':  # split
                     # make another hand from second card
-                    hand: Hand = self._player_hands[i].split()
+                    split_hand: Hand = hand.split()
 
                     # add new hand to player's hands
-                    self._player_hands.insert(i + 1, hand)
+                    self._player_hands.insert(i + 1, split_hand)
                     self._bets.insert(i + 1, self._bets[i])
+                    self._bets_total += self._bets[i]
                     self._results.insert(i + 1, None)
 
                     self._show_hands()
@@ -301,24 +330,26 @@ class Blackjack:
 
                 card: Card = self._deck.draw_card()  # draw card for player
 
-                self._player_hands[i].add(card)
+                hand.add(card)
+
+                score: int = hand.score  # worked out once per card
 
                 self._show_hands()
 
-                if self._player_hands[i].is_busted:  # hand is busted: loss
+                if score > 21:  # hand is busted: loss
                     print(
-                        f'<Hand {i + 1}> is busted with {self._player_hands[i].score}', end='\n\n')
+                        f'<Hand {i + 1}> is busted with {score}', end='\n\n')
 
                     self._results[i] = -self._bets[i]
 
                     break
 
-                if self._player_hands[i].is_21:
+                if score == 21:
                     # hand had previously split and house rules allow naturals after splits: 1.5x win
-                    if self.natural_after_split and len(self._player_hands[i]) == 2:
+                    if natural_after_split and len(hand) == 2:
                         print(f'<Hand {i + 1}> has a natural', end='\n\n')
 
-                        self._results[i] = int(round(self._bets[i] * 1.5))
+                        self._results[i] = self._bets[i] * 3 // 2
 
                     else:  # non-natural 21
                         print(f'<Hand {i + 1}> has 21', end='\n\n')
@@ -337,21 +368,26 @@ class Blackjack:
 
         # at least one player hand is under 21 (round is not over)
         if any(result is None for result in self._results):
-            self._house_hand[1].flip()  # reveal house card
+            self._house_hand.flip(1)  # reveal house card
 
             self._show_hands()
 
+            house_hand: Hand = self._house_hand
+            h17: bool = self._h17
+
             # while dealer score is under 17 (taking into account soft 17 rule)
-            while self._house_hand.score < 17 or self._house_hand.is_s17 and self.h17:
+            while house_hand.score < 17 or house_hand.is_s17 and h17:
                 card: Card = self._deck.draw_card()  # draw new card
 
-                self._house_hand.add(card)
+                house_hand.add(card)
 
                 self._show_hands()
 
-            if self._house_hand.is_busted:
+            house_score: int = house_hand.score
+
+            if house_score > 21:  # house is busted
                 print(
-                    f'<House> is busted with {self._house_hand.score}', end='\n\n')
+                    f'<House> is busted with {house_score}', end='\n\n')
 
                 for i in range(len(self._player_hands)):
                     if self._results[i] is None:
@@ -363,16 +399,25 @@ class Blackjack:
         Go through player hands and show the results of each bet
         """
 
+        house_score: int = self._house_hand.score
+        house_natural: bool = house_score == 21 and len(self._house_hand) == 2
+
         # house finished its hand
-        if not self._house_hand.has_flipped_cards and not (self._house_hand.score == 21 and len(self._house_hand) == 2):
-            print(f'<House> has {self._house_hand.score}',
+        if not self._house_hand.has_flipped_cards and not house_natural:
+            print(f'<House> has {house_score}',
                   end='\n\n')  # display house's score
 
         for i in range(len(self._player_hands)):
+            hand: Hand = self._player_hands[i]
+            score: int = hand.score
+            # 21 with two cards, only counted after splitting if house rules allow it
+            is_natural: bool = score == 21 and len(hand) == 2 and (
+                not hand.times_split or self._natural_after_split)
+
             # house was a natural
-            if self._house_hand.score == 21 and len(self._house_hand) == 2:
+            if house_natural:
                 # player hand was a natural: tie
-                if self._player_hands[i].score == 21:
+                if score == 21:
                     print(f'<Hand {i + 1}> ties with a natural -> +$0')
 
                 # player hand was not natural (and house was a natural): loss
@@ -381,44 +426,46 @@ class Blackjack:
                         f'<Hand {i + 1}> loses with no natural -> -${self._bets[i]}')
 
             # player hand was a natural: 1.5x win
-            elif self._player_hands[i].score == 21 and self._results[i] == round(self._bets[i] * 1.5):
+            elif is_natural:
                 print(
                     f'<Hand {i + 1}> wins with a natural -> +${self._results[i]}')
 
             # player hand was busted: loss
-            elif self._player_hands[i].score > 21:
+            elif score > 21:
                 print(
-                    f'<Hand {i + 1}> loses with a busted {self._player_hands[i].score} -> -${self._bets[i]}')
+                    f'<Hand {i + 1}> loses with a busted {score} -> -${self._bets[i]}')
 
-            elif self._house_hand.is_busted:  # house was busted: win
+            elif house_score > 21:  # house was busted: win
                 print(
-                    f'<Hand {i + 1}> wins with a non-busted {self._player_hands[i].score} -> +${self._bets[i]}')
+                    f'<Hand {i + 1}> wins with a non-busted {score} -> +${self._bets[i]}')
 
             # house score was greater than player score: loss
-            elif self._player_hands[i].score < self._house_hand.score:
+            elif score < house_score:
                 print(
-                    f'<Hand {i + 1}> loses with {self._player_hands[i].score} < {self._house_hand.score} -> -${self._bets[i]}')
+                    f'<Hand {i + 1}> loses with {score} < {house_score} -> -${self._bets[i]}')
 
                 self._results[i] = -self._bets[i]
 
             # player score was greater than house score: win
-            elif self._player_hands[i].score > self._house_hand.score:
+            elif score > house_score:
                 print(
-                    f'<Hand {i + 1}> wins with {self._player_hands[i].score} > {self._house_hand.score} -> +${self._bets[i]}')
+                    f'<Hand {i + 1}> wins with {score} > {house_score} -> +${self._bets[i]}')
 
                 self._results[i] = self._bets[i]
 
             else:  # player score was equal to house score: tie
                 print(
-                    f'<Hand {i + 1}> ties with {self._player_hands[i].score} = {self._house_hand.score} -> +$0')
+                    f'<Hand {i + 1}> ties with {score} = {house_score} -> +$0')
 
                 self._results[i] = 0
 
         print()
 
-    def _end_round(self) -> None:
+    def _settle_round(self) -> int:
         """
-        Shows result of round and asks to play again
+        Pays out the player's bets and shows the result of the round
+
+        :return: The change in the player's money
         """
 
         result: int = sum(self._results)  # change in money
@@ -437,6 +484,17 @@ class Blackjack:
 
         self._rounds_played += 1
 
+        return -result if neg else result
+
+    def _end_round(self) -> None:
+        """
+        Shows result of round and asks to play again
+        """
+
+        self._settle_round()
+
+        self._play_again: bool = False
+
         if self.money_left >= self.min_bet:  # player has enough money to play another round
             play_again = input('Play Again? (y/n): ').lower()
 
@@ -444,28 +502,60 @@ class Blackjack:
                 raise ValueError(
                     f'answer must be one of (y/n), got {play_again!r}')
 
-            if play_again == 'y':
-                self.play()
-
-            else:
-                clear_output()
+            self._play_again: bool = play_again == 'y'
 
-        else:  # player does not have enough money to play another round
+        # player is done or does not have enough money to play another round
+        if not self._play_again and not self.fast_mode:
             clear_output()
 
     def play(self) -> None:
         """
-        Plays a round of blackjack
+        Plays rounds of blackjack until the player stops or runs out of money
+        """
+
+        self._play_again: bool = True
+
+        while self._play_again:  # set at the end of each round
+            self._start_round()
+            self._collect_bets()
+            self._deal()
+            self._check_naturals()
+            self._player_turn()
+            self._house_turn()
+            self._show_results()
+            self._end_round()
+
+    def play_many(self, num_rounds: int, policy: Callable[[Hand, Card, List[str]], str], num_hands: int = 1, bet: Optional[int] = None) -> List[int]:
+        """
+        Plays several rounds of blackjack in a row without asking the player for anything
+        Stops early if the player can no longer afford the bets
+
+        :param num_rounds: The number of rounds to play
+        :param policy: Chooses an action given the hand, the house's face-up card and the possible choices (i.e. 'h')
+        :param num_hands: The number of hands to play each round
+        :param bet: The bet to place on each hand (None for the minimum bet)
+        :return: The change in the player's money for each round played
         """
 
-        self._start_round()
-        self._collect_bets()
-        self._deal()
-        self._check_naturals()
-        self._player_turn()
-        self._house_turn()
-        self._show_results()
-        self._end_round()
+        bet: int = bet if bet is not None else self.min_bet
+
+        results: List[int] = []
+
+        for _ in range(num_rounds):
+            if self.money_left < bet * num_hands:
+                break  # player cannot afford another round
+
+            self._start_round(num_hands=num_hands)
+            self._collect_bets(starting_bet=bet)
+            self._deal()
+            self._check_naturals()
+            self._player_turn(policy=policy)
+            self._house_turn()
+            self._show_results()
+
+            results.append(self._settle_round())
+
+        return results
 
     @property
     def deck(self) -> Deck:
@@ -507,6 +597,10 @@ class Blackjack:
     def max_bet(self) -> Optional[int]:
         return self._max_bet
 
+    @property
+    def fast_mode(self) -> bool:
+        return self._fast_mode
+
     @property
     def rounds_played(self) -> int:
         return self._rounds_played
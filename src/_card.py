@@ -1,20 +1,23 @@
 from __future__ import annotations
-from typing import Union
+from functools import total_ordering
+from typing import Tuple
 
 from _symbols import RANK_SYMBOLS, SUIT_SYMBOLS
 from _types import Rank, Suit
 
 
+@total_ordering
 class Card:
     """
     The Card class, which represents a single playing card
     """
 
-    def __init__(self, rank: Rank, suit: Suit = 0, is_flipped: bool = False) -> None:
+    __slots__ = ('_rank', '_suit', '_value', '_symbol')
+
+    def __init__(self, rank: Rank, suit: Suit = 0) -> None:
         """
         :param rank: The rank of the card (1=A, 2=2, ..., 13=K)
         :param suit: The suit of the card (1=♠, 2=♥, 3=♦, 4=♣)
-        :param is_flipped: Whether or not the card is visible to the user
         """
 
         if not (0 <= rank <= 13):
@@ -25,60 +28,50 @@ class Card:
 
         self._rank: Rank = rank
         self._suit: Suit = suit
-        self._is_flipped: bool = is_flipped
+
+        self._value: int
 
         if self == 1:  # A
-            self._value: int = 11  # aces are worth 11 to start
+            self._value = 11  # aces are worth 11 to start
 
         elif 11 <= self <= 13:  # J-K
-            self._value: int = 10  # face cards are worth 10
+            self._value = 10  # face cards are worth 10
 
         else:  # 0, 2-10
-            self._value: int = self.rank  # numeric and stop cards are worth their rank
-
-    def __repr__(self) -> str:
-        if self.is_flipped:
-            return '🂠'  # flipped cards are not displayed to the player
-
-        # show card's rank and suit, i.e. '4♥'
-        return self.rank_symbol + self.suit_symbol
+            self._value = self.rank  # numeric and stop cards are worth their rank
 
-    def __eq__(self, other: Union[Card, Rank]) -> bool:
-        if isinstance(other, Rank):
-            return self.rank == other  # compare card's rank to a rank number
+        # cards can't change, so how they're shown is worked out once, i.e. '4♥'
+        self._symbol: str = self.rank_symbol + self.suit_symbol
 
-        return self.rank == other.rank  # compare card's rank to another card's rank
-
-    def __gt__(self, other: Union[Card, Rank]) -> bool:
-        if isinstance(other, Rank):
-            return self.rank > other  # compare card's rank to a rank number
-
-        return self.rank > other.rank  # compare card's rank to another card's rank
+    def __repr__(self) -> str:
+        # show card's rank and suit
+        return self._symbol
 
-    def __lt__(self, other: Union[Card, Rank]) -> bool:
-        if isinstance(other, Rank):
-            return self.rank < other  # compare card's rank to a rank number
+    def __eq__(self, other: object) -> bool:
+        # compare card's rank to a rank number or to another card's rank
+        if type(other) is int:  # exact check first, rank numbers are the common case
+            return self._rank == other
 
-        return self.rank < other.rank  # compare card's rank to another card's rank
+        if isinstance(other, Card):
+            return self._rank == other._rank
 
-    def __ge__(self, other: Union[Card, Rank]) -> bool:
-        if isinstance(other, Rank):
-            return self.rank >= other  # compare card's rank to a rank number
+        if isinstance(other, int):  # int subclasses, i.e. bool
+            return self._rank == other
 
-        return self.rank >= other.rank  # compare card's rank to another card's rank
+        return NotImplemented
 
-    def __le__(self, other: Union[Card, Rank]) -> bool:
-        if isinstance(other, Rank):
-            return self.rank <= other  # compare card's rank to a rank number
+    def __lt__(self, other: object) -> bool:
+        # the other orderings are filled in by total_ordering
+        if type(other) is int:
+            return self._rank < other
 
-        return self.rank <= other.rank  # compare card's rank to another card's rank
+        if isinstance(other, Card):
+            return self._rank < other._rank
 
-    def flip(self) -> None:
-        """
-        Flips a card, making it either visible or not visible
-        """
+        if isinstance(other, int):
+            return self._rank < other
 
-        self._is_flipped: bool = not self.is_flipped  # change the card's flipped value
+        return NotImplemented
 
     @property
     def rank(self) -> Rank:
@@ -88,33 +81,10 @@ class Card:
     def suit(self) -> Suit:
         return self._suit
 
-    @property
-    def is_flipped(self) -> bool:
-        # if card isn't a stop card, it could be flipped, otherwise it couldn't be
-        return self._is_flipped if self != 0 else False
-
     @property
     def value(self) -> int:
         return self._value
 
-    @value.setter
-    def value(self, value: int) -> None:
-        """
-        Can change the value of an ace
-
-        :param value: The new value of the ace (must be either 11 or 1)
-        """
-
-        if self != 1:
-            raise ValueError(
-                f'card must be an ace to change value, is {self.rank_symbol!r}')
-
-        if value not in (11, 1):
-            raise ValueError(
-                f'new value must be one of (11, 1), got {value}')
-
-        self._value: int = value  # change the value of an ace to 11 or 1
-
     @property
     def rank_symbol(self) -> str:
         # stop cards are shown as a blank rectangle
@@ -132,4 +102,42 @@ class Card:
         :return: The stop card
         """
 
-        return Card(0)  # stop cards have a rank of 0 and no suit
+        return STOP  # stop cards have a rank of 0 and no suit
+
+    @classmethod
+    def get(cls, rank: Rank, suit: Suit) -> Card:
+        """
+        Returns the shared card with the given rank and suit, instead of making a new one
+
+        :param rank: The rank of the card (0=stop card, 1=A, 2=2, ..., 13=K)
+        :param suit: The suit of the card (1=♠, 2=♥, 3=♦, 4=♣), ignored for the stop card
+        :return: The shared card
+        """
+
+        if rank == 0:
+            return STOP
+
+        if not (1 <= rank <= 13):
+            raise ValueError(f'rank must be 0-13, got {rank}')
+
+        if not (1 <= suit <= 4):
+            raise ValueError(f'suit must be 1-4, got {suit}')
+
+        return CARD_POOL[rank - 1][suit - 1]
+
+    @classmethod
+    def _from_byte(cls, byte: int) -> Card:
+        """
+        Unpacks a card stored by the deck as a single byte (rank * 4 + suit - 1, or 0 for the stop card)
+
+        :param byte: The packed card
+        :return: The shared card with that rank and suit
+        """
+
+        return CARD_POOL[(byte >> 2) - 1][byte & 3] if byte else STOP
+
+
+# cards hold no per-game state, so every deck shares one card per rank and suit (CARD_POOL[rank - 1][suit - 1])
+CARD_POOL: Tuple[Tuple[Card, ...], ...] = tuple(tuple(Card(rank, suit) for suit in range(1, 5))
+                                                for rank in range(1, 14))
+STOP: Card = Card(0)
@@ -1,6 +1,7 @@
 from _card import Card
 
-STOP_CARD = Card(0)
+STOP_CARD = Card.stop_card()
+STOP_BYTE = 0  # the stop card as packed by the deck
 ACE = Card(1)
 TWO = Card(2)
 THREE = Card(3)
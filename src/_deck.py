@@ -1,9 +1,15 @@
 from random import randint, shuffle
 from time import sleep
-from typing import List
+from typing import List, Optional, Tuple
 
 from _card import Card
-from _cards import STOP_CARD
+from _cards import STOP_BYTE
+
+# a single 52-card deck in order, each card packed as one byte (rank * 4 + suit - 1)
+PACKED_DECK: bytes = bytes(range(4, 56))
+# the value of each packed card, for unpacking many values at once with bytes.translate
+# bytes 0-3 (the stop card and unused bytes) and anything past 55 aren't cards, so they're worth 0
+PACKED_VALUES: bytes = (bytes(4) + bytes(Card._from_byte(byte).value for byte in PACKED_DECK)).ljust(256, b'\0')
 
 
 class Deck:
@@ -11,14 +17,16 @@ class Deck:
     The Deck class, which represents a deck of cards
     """
 
-    def __init__(self, num_decks: int = 1, use_stop_card: bool = False) -> None:
+    def __init__(self, num_decks: int = 1, use_stop_card: bool = False, fast_mode: bool = False) -> None:
         """
         :param num_decks: The number of decks to use
         :param use_stop_card: Whether the deck should have a card placed near the bottom to prevent card counting
+        :param fast_mode: Whether to skip the shuffling animation
         """
 
         self._num_decks: int = num_decks
         self._use_stop_card: bool = use_stop_card
+        self._fast_mode: bool = fast_mode
 
         # keep track of when a deck needs to be reshuffled after the round
         self._insert_reached: bool = False
@@ -31,34 +39,46 @@ class Deck:
         Resets the deck with its original number of cards in a random order
         """
 
-        self._cards: List[Card] = [Card(i, j, is_flipped=True) for i in range(1, 14)
-                                   for j in range(1, 5) for _ in range(self._num_decks)]  # makes the necessary amount of 52-card decks
+        # makes the necessary amount of packed 52-card decks
+        self._cards: bytearray = bytearray(PACKED_DECK * self._num_decks)
+
+        shuffle(self._cards)
 
-        shuffle(self.cards)
+        # remember where the stop card is, cards below the top don't move so it can't change until it's drawn
+        self._stop_index: Optional[int] = None
 
         if self.use_stop_card:
             # stop card is inserted near the end of the deck randomly
-            self.cards.insert(randint(60, 75), Card.stop_card())
+            self._stop_index: Optional[int] = randint(60, 75)
+
+            self._cards.insert(self._stop_index, STOP_BYTE)
+
+        # cards are drawn by moving down from the top of the deck instead of removing them
+        self._top: int = len(self._cards) - 1
 
     def shuffle(self) -> None:
         """
         Shuffles the cards of the deck
         """
 
-        # display shuffling animation
-        print('Shuffling', end='')
-        sleep(0.5)
+        if self.fast_mode:
+            print('Shuffling....', end='\n\n')
 
-        for _ in range(3):
-            print('.', end='')
+        else:
+            # display shuffling animation
+            print('Shuffling', end='')
             sleep(0.5)
 
-        print('.', end='\n\n')
-        sleep(0.5)
+            for _ in range(3):
+                print('.', end='')
+                sleep(0.5)
+
+            print('.', end='\n\n')
+            sleep(0.5)
 
         self._reset_cards()  # remake the deck and shuffle it
 
-    def draw_card(self, face_down: bool = False) -> Card:
+    def draw_card(self) -> Card:
         """
         Removes the top card from the deck and returns it
         If the deck is empty, it will reshuffle the cards
@@ -66,24 +86,63 @@ class Deck:
         :return: The top card of the deck
         """
 
-        if not self.cards:  # deck is empty
+        if self._top < 0:  # deck is empty
             print('Out of cards...')
 
             self.shuffle()  # reset the deck
 
-        card: Card = self.cards.pop()  # draw a card
+        byte: int = self._cards[self._top]  # draw a card
+        self._top -= 1
 
-        if card == STOP_CARD:  # drawn card was stop card
+        if byte == STOP_BYTE:  # drawn card was stop card
             self._insert_reached: bool = True  # remember to shuffle deck after round
+            self._stop_index: Optional[int] = None
 
             print('Insert Reached...')
 
-            card: Card = self.cards.pop()  # draw a replacement card
+            # draw a replacement card
+            byte: int = self._cards[self._top]
+            self._top -= 1
+
+        # only the card that is handed out is unpacked
+        return Card._from_byte(byte)
+
+    def draw_many(self, num_cards: int) -> bytes:
+        """
+        Removes several cards from the top of the deck at once and returns them packed (rank * 4 + suit - 1)
+        If the deck runs out, it will reshuffle the cards
+
+        :param num_cards: The number of cards to draw
+        :return: The packed cards, in the order they would have been drawn one at a time
+        """
+
+        cards: bytearray = bytearray()
+
+        while len(cards) < num_cards:
+            if self._top < 0:  # deck is empty
+                print('Out of cards...')
+
+                self.shuffle()  # reset the deck
+
+            # take as many of the needed cards as are left in one slice
+            start: int = max(self._top - (num_cards - len(cards)) + 1, 0)
+            drawn: bytearray = self._cards[start:self._top + 1]
+            drawn.reverse()  # top card first
 
-        if not face_down:
-            card.flip()  # give it to player face up if not specified
+            self._top: int = start - 1
 
-        return card
+            # stop card is never below the top, so it was drawn if it's in the slice
+            if self._stop_index is not None and self._stop_index >= start:
+                self._insert_reached: bool = True  # remember to shuffle deck after round
+                self._stop_index: Optional[int] = None
+
+                print('Insert Reached...')
+
+                drawn.remove(STOP_BYTE)  # the next pass draws its replacement
+
+            cards += drawn
+
+        return bytes(cards)
 
     @property
     def num_decks(self) -> int:
@@ -93,13 +152,18 @@ class Deck:
     def use_stop_card(self) -> bool:
         return self._use_stop_card
 
+    @property
+    def fast_mode(self) -> bool:
+        return self._fast_mode
+
     @property
     def num_cards(self) -> int:
         return self._num_cards
 
     @property
-    def cards(self) -> List[Card]:
-        return self._cards
+    def cards(self) -> bytearray:
+        # packed cards that haven't been drawn yet
+        return self._cards[:self._top + 1]
 
     @property
     def insert_reached(self) -> bool:
@@ -118,7 +182,58 @@ class Deck:
     def cards_left(self) -> int:
         if not self.use_stop_card:
             # deck without stop card has all of its cards left
-            return len(self.cards)
+            return self._top + 1
+
+        if self._stop_index is None:
+            return 0  # stop card was already reached
 
         # cards left until stop card
-        return len(self.cards) - self.cards.index(Card.stop_card()) - 1
+        return self._top - self._stop_index
+
+
+def evaluate_hands(values: bytes, hand_size: int) -> Tuple[List[int], List[bool], List[bool]]:
+    """
+    Evaluates many hands at once, given their card values one hand after another
+    Shorter hands can be padded with zeros up to the hand size, since that doesn't change their scores
+    Aces are counted as 1 where needed to keep a hand from busting, like in Hand
+
+    :param values: The card values of every hand, one byte per card (11 for an ace)
+    :param hand_size: The number of values given for each hand
+    :return: The score of each hand, whether each hand is busted, and whether each hand is soft
+    """
+
+    scores: List[int] = []
+    busted: List[bool] = []
+    soft: List[bool] = []
+
+    for i in range(0, len(values), hand_size):
+        hand: bytes = values[i:i + hand_size]
+        # both run over the bytes in C
+        score: int = sum(hand)
+        soft_aces: int = hand.count(11)
+
+        if score > 21 and soft_aces:  # count as many 11-aces as 1 as needed
+            demoted: int = min(soft_aces, (score - 12) // 10)
+
+            score -= 10 * demoted
+            soft_aces -= demoted
+
+        scores.append(score)
+        busted.append(score > 21)
+        soft.append(soft_aces > 0)
+
+    return scores, busted, soft
+
+
+def score_packed_hands(cards: bytes, hand_size: int) -> List[int]:
+    """
+    Scores many hands at once, given their packed cards one hand after another (i.e. from Deck.draw_many)
+    Aces are counted as 1 where needed to keep a hand from busting
+
+    :param cards: The packed cards of every hand
+    :param hand_size: The number of cards in each hand
+    :return: The score of each hand
+    """
+
+    # unpack every card's value in one pass
+    return evaluate_hands(cards.translate(PACKED_VALUES), hand_size)[0]
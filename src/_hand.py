@@ -1,8 +1,47 @@
 from __future__ import annotations
-from typing import Iterable, List, Union
+from typing import Iterable, Iterator, List, Optional
 
 from _card import Card
-from _cards import ACE, SIX
+from _symbols import FLIPPED_SYMBOL
+
+# whether a two-card hand can be split, indexed by first rank * 16 + second rank
+# face cards don't need to have the same rank to split (any 10-card will do), otherwise the ranks have to match
+SPLIT_TABLE: bytes = bytes(first > 10 and second >= 10 or first == second
+                           for first in range(16) for second in range(16))
+
+
+def _count_ranks(cards: Iterable[Card]) -> bytes:
+    """
+    Counts the cards of each rank, so hands with the same ranks in any order get equal bytes
+
+    :param cards: The cards to count
+    :return: The count of each card rank, indexed by rank
+    """
+
+    counts: bytearray = bytearray(14)  # ranks 0-13
+
+    for card in cards:
+        counts[card.rank] += 1
+
+    return bytes(counts)
+
+
+def _demote_aces(values: bytearray, demoted: int) -> None:
+    """
+    Changes the first 11-aces in a hand's packed values to 1-aces, in place
+    The aces are found with bytearray.index, which searches the bytes in C
+
+    :param values: The packed card values of a hand
+    :param demoted: The number of 11-aces to change, at least 1 and no more than the hand has
+    """
+
+    i: int = values.index(11)
+    values[i] = 1
+
+    while demoted > 1:  # only when more than one ace has to drop
+        i = values.index(11, i)
+        values[i] = 1
+        demoted -= 1
 
 
 class Hand:
@@ -10,9 +49,12 @@ class Hand:
     The Hand class, which represents one or more cards that a player is holding
     """
 
+    __slots__ = ('_cards', '_values', '_flipped_mask', '_score',
+                 '_soft_aces', '_key', '_times_split')
+
     def __init__(self, *args: Card, times_split: int = 0) -> None:
         """
-        :param cards: The cards of the hand, or None for an empty hand
+        :param args: The cards of the hand, or none for an empty hand
         :param times_split: The number of times the hand has previously been split
         """
 
@@ -21,56 +63,116 @@ class Hand:
                 f'times split must be at least 0, got {times_split}')
 
         self._cards: List[Card] = list(args)
+        # cards are shared between hands, so a hand keeps its own card values (aces can drop to 1) and flipped states
+        # values are packed one byte per card so they can be added up and searched without a Python loop
+        self._values: bytearray = bytearray(card.value for card in args)
+        self._flipped_mask: int = 0  # bit i is set when card i is flipped
+        # running totals, updated as cards are added instead of adding up the hand every time
+        self._score: int = sum(self._values)
+        self._soft_aces: int = self._values.count(11)  # aces still counted as 11
+        self._key: Optional[bytes] = None  # count of each card rank, made when first compared
         # keep track of the times a player split a hand, house rules can limit this
         self._times_split: int = times_split
 
     def __repr__(self) -> str:
-        return repr(self.cards)
+        # flipped cards are not displayed to the player
+        return '[' + ', '.join(FLIPPED_SYMBOL if self._flipped_mask >> i & 1 else repr(card) for i, card in enumerate(self)) + ']'
 
-    def __iter__(self) -> Iterable[Card]:
+    def __iter__(self) -> Iterator[Card]:
         return iter(self.cards)
 
-    def __getitem__(self, i) -> Card:
+    def __getitem__(self, i: int) -> Card:
         return self.cards[i]
 
-    def __eq__(self, other: Union[Hand, List[Card]]) -> bool:
+    def __eq__(self, other: object) -> bool:
         # order doesn't matter when comparing hands, must have same length and card ranks
-        return sorted(self) == sorted(other)
+        if isinstance(other, Hand):
+            return self._get_key() == other._get_key()
+
+        if not isinstance(other, (list, tuple)):
+            return NotImplemented
+
+        # cards or rank numbers, counted the same way as _count_ranks
+        counts: bytearray = bytearray(14)  # ranks 0-13
+
+        for card in other:
+            rank: object = card.rank if isinstance(card, Card) else card
+
+            if not isinstance(rank, int):
+                return NotImplemented  # not a card or a rank number
+
+            if not (0 <= rank <= 13):
+                return False  # no card has that rank
+
+            counts[rank] += 1
+
+        return self._get_key() == counts
 
     def __len__(self) -> int:
         return len(self.cards)
 
+    def _get_key(self) -> bytes:
+        """
+        Returns how many of each card rank the hand has, which is kept until the hand changes
+
+        :return: The count of each card rank
+        """
+
+        if self._key is None:
+            self._key = _count_ranks(self)
+
+        return self._key
+
     def _orient_hand(self) -> None:
         """
         If the hand is busted, changes 11-aces to 1-aces where possible
         """
 
-        while self.is_busted:  # check if the hand is still busted
-            for card in self:  # look for 11-aces
-                if card.value == 11:  # 11-ace
-                    card.value = 1  # 11 -> 1
+        if self._score > 21 and self._soft_aces:  # busted and 11-aces left
+            # just enough 11-aces to get back to 21 or under, if there are that many
+            demoted: int = min(self._soft_aces, (self._score - 12) // 10)
 
-                    break  # check if hand is no longer busted
+            self._score -= 10 * demoted
+            self._soft_aces -= demoted
 
-            else:
-                break  # no 11-aces found
+            _demote_aces(self._values, demoted)
 
-    def add(self, card: Card, front: bool = False) -> None:
+    def add(self, card: Card, front: bool = False, face_down: bool = False) -> None:
         """
         Adds a card to the hand
 
         :param card: The card to add
         :param front: Whether to put the card at the front of the hand
+        :param face_down: Whether the card is not visible to the user
         """
 
         if not front:
+            self._flipped_mask |= face_down << len(self)
             self.cards.append(card)  # add card to back of hand
+            self._values.append(card.value)
         else:
-            self._cards: List[Card] = [card] + \
-                self.cards  # add card to front of hand
+            self.cards.insert(0, card)  # add card to front of hand, in place
+            self._values.insert(0, card.value)
+            # every other card moves back one position
+            self._flipped_mask = self._flipped_mask << 1 | face_down
+
+        self._score += card.value
+        self._soft_aces += int(card.value == 11)
+        self._key = None  # ranks changed
 
         self._orient_hand()  # card might have busted hand, try to reduce 11-aces
 
+    def flip(self, i: int) -> None:
+        """
+        Flips a card in the hand, making it either visible or not visible
+
+        :param i: The position of the card in the hand
+        """
+
+        # stop cards can't be flipped
+        if self[i] != 0:
+            self._flipped_mask ^= 1 << i % len(self)  # change the card's flipped value
+
     def split(self) -> Hand:
         """
         Splits the hand into two hands, one with the first card and one with the second card
@@ -80,70 +182,119 @@ class Hand:
 
         self._times_split += 1  # increase the first hand's times_split
 
-        if self[0].value == 1:  # 1-ace
-            self[0].value = 11  # 1 -> 11
+        if self._values[0] == 1:  # 1-ace
+            self._values[0] = 11  # 1 -> 11
 
         # take second card out of hand
         card: Card = self.cards.pop()
+        self._values.pop()
+        face_down: bool = self._flipped_mask >> 1 & 1 == 1  # the second card keeps its flipped state
+        self._flipped_mask &= 1  # only the first card's bit is left
+        self._key = None  # ranks changed
+
+        # only the first card is left
+        self._score = self._values[0]
+        self._soft_aces = int(self._values[0] == 11)
 
         # return second card as a new hand along with times the hand has been split
-        return Hand(card, times_split=self.times_split)
+        return Hand._from_single(card, self._times_split, face_down)
+
+    @classmethod
+    def _from_single(cls, card: Card, times_split: int, face_down: bool = False) -> Hand:
+        """
+        Makes a hand holding one card, skipping the argument packing and validation done by __init__
+
+        :param card: The card of the hand
+        :param times_split: The number of times the hand has previously been split
+        :param face_down: Whether the card is not visible to the user
+        :return: The new hand
+        """
+
+        hand: Hand = cls.__new__(cls)
+
+        hand._cards = [card]
+        hand._values = bytearray((card.value,))
+        hand._flipped_mask = int(face_down)
+        hand._score = card.value
+        hand._soft_aces = int(card.value == 11)
+        hand._key = None
+        hand._times_split = times_split
+
+        return hand
 
     @property
     def cards(self) -> List[Card]:
         return self._cards
 
     @property
-    def times_split(self) -> bool:
+    def times_split(self) -> int:
         return self._times_split
 
     @property
     def display_score(self) -> str:
-        if not [card for card in self if not card.is_flipped]:  # no cards are visible yet
+        if self._flipped_mask == (1 << len(self)) - 1:  # no cards are visible yet
             return ''  # no score is shown
 
-        # visible score is the sum of the values for all visible cards
-        score: int = sum(card.value for card in self if not card.is_flipped)
+        score: int
+        has_11_ace: bool
+
+        if not self._flipped_mask:  # every card is visible
+            score = self._score
+            has_11_ace = self._soft_aces > 0
+
+        else:
+            # visible score is the sum of the values for all visible cards, found with any visible 11-aces in one pass
+            score = 0
+            has_11_ace = False
+            flipped_mask: int = self._flipped_mask
+
+            for value in self._values:
+                if not flipped_mask & 1:  # card is visible
+                    score += value
+                    has_11_ace = has_11_ace or value == 11
+
+                flipped_mask >>= 1  # next card's bit
 
         if score >= 21:  # hand is busted
             return str(score)  # only possible score
 
-        score: int = f'{score}/{score-10}' if any(
-            card.value == 11 for card in self if not card.is_flipped) else str(score)  # hands with aces are shown with 2 possible scores
+        # hands with aces are shown with 2 possible scores
+        display_score: str = f'{score}/{score-10}' if has_11_ace else str(score)
 
-        if self.has_flipped_cards:
-            score += '+'  # hands with flipped cards are signified as actually having a higher score
+        if self._flipped_mask:
+            display_score += '+'  # hands with flipped cards are signified as actually having a higher score
 
-        return score
+        return display_score
 
     @property
     def score(self) -> int:
         # true score is sum of all card values
-        return sum(card.value for card in self)
+        return self._score
+
+    @property
+    def is_soft(self) -> bool:
+        # soft hands have an ace still counted as 11
+        return self._soft_aces > 0
 
     @property
     def is_busted(self) -> bool:
-        return self.score > 21  # busted hands are hands over 21
+        return self._score > 21  # busted hands are hands over 21
 
     @property
     def is_21(self) -> bool:
-        return self.score == 21  # hands with 21 are completed
+        return self._score == 21  # hands with 21 are completed
 
     @property
     def has_flipped_cards(self) -> bool:
         # hands with flipped cards still have to be played
-        return any(card.is_flipped for card in self)
+        return self._flipped_mask != 0
 
     @property
     def can_split(self) -> bool:
         if len(self) != 2:
             return False  # can only split hands that have exactly 2 cards
 
-        if self[0] > 10:
-            # face cards don't need to have the same rank to split
-            return self[0].value == self[1].value
-
-        return self.can_split_same  # otherwise the ranks have to match to split
+        return SPLIT_TABLE[self._cards[0].rank << 4 | self._cards[1].rank] == 1
 
     @property
     def can_split_same(self) -> bool:
@@ -153,4 +304,6 @@ class Hand:
     @property
     def is_s17(self) -> bool:
         # soft 17 (A and 6), where the house either hits or stands, depending on house rules
-        return self == (ACE, SIX)
+        # A and 6 is the only two-card hand with 17 and an 11-ace
+        return len(self) == 2 and self._score == 17 and self._soft_aces == 1
+
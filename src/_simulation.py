@@ -0,0 +1,236 @@
+from random import randint, shuffle
+from typing import List, Optional
+
+from _cards import STOP_BYTE
+from _deck import PACKED_DECK, PACKED_VALUES
+from _strategy import choose_action
+
+# house rules, combined with | into the rules of a simulation
+H17: int = 1
+CAN_DD_AFTER_SPLIT: int = 2
+NATURAL_AFTER_SPLIT: int = 4
+CAN_SPLIT_DIFF_TENS: int = 8
+ONE_HIT_ACE_SPLIT: int = 16
+# same house rules as a default Blackjack game
+DEFAULT_RULES: int = H17 | CAN_DD_AFTER_SPLIT | NATURAL_AFTER_SPLIT | CAN_SPLIT_DIFF_TENS | ONE_HIT_ACE_SPLIT
+
+# positions of a simulated hand's fields, hands are kept as lists of ints instead of Hand objects
+SCORE, SOFT_ACES, NUM_CARDS, FIRST_RANK, SECOND_RANK, TIMES_SPLIT = range(6)
+
+
+def _add(hand: List[int], byte: int) -> None:
+    """
+    Adds a packed card to a simulated hand, counting 11-aces as 1 while the hand is busted
+
+    :param hand: The simulated hand
+    :param byte: The packed card (rank * 4 + suit - 1)
+    """
+
+    value: int = PACKED_VALUES[byte]
+
+    if hand[NUM_CARDS] < 2:  # only the first two ranks matter, for splitting
+        hand[FIRST_RANK + hand[NUM_CARDS]] = byte >> 2
+
+    hand[SCORE] += value
+    hand[SOFT_ACES] += value == 11
+    hand[NUM_CARDS] += 1
+
+    while hand[SCORE] > 21 and hand[SOFT_ACES]:  # 11 -> 1
+        hand[SCORE] -= 10
+        hand[SOFT_ACES] -= 1
+
+
+def simulate_rounds(num_rounds: int, rules: int = DEFAULT_RULES, max_splits: Optional[int] = 3, num_decks: int = 6, use_stop_card: bool = True, bet: int = 2) -> List[int]:
+    """
+    Plays rounds of one starting hand with basic strategy, using only packed cards and ints instead of Card, Hand and Deck objects
+    Follows the same rules and draws from the shoe the same way as Blackjack.play_many with basic_strategy, with unlimited money
+
+    :param num_rounds: The number of rounds to play
+    :param rules: The house rules, combined with | (i.e. H17 | CAN_DD_AFTER_SPLIT)
+    :param max_splits: The maxmimum number of times the player can split in a round (None for unlimited)
+    :param num_decks: The number of decks to use throughout the game
+    :param use_stop_card: Whether the deck should have a card placed near the bottom to prevent card counting
+    :param bet: The bet placed on the starting hand
+    :return: The change in the player's money for each round
+    """
+
+    h17: bool = bool(rules & H17)
+    can_dd_after_split: bool = bool(rules & CAN_DD_AFTER_SPLIT)
+    natural_after_split: bool = bool(rules & NATURAL_AFTER_SPLIT)
+    can_split_diff_tens: bool = bool(rules & CAN_SPLIT_DIFF_TENS)
+    one_hit_ace_split: bool = bool(rules & ONE_HIT_ACE_SPLIT)
+
+    shoe: bytearray = bytearray()
+    top: int = -1
+    insert_reached: bool = False
+
+    def reset() -> None:
+        """
+        Remakes and shuffles the shoe, the same way as Deck._reset_cards
+        """
+
+        nonlocal shoe, top
+
+        shoe = bytearray(PACKED_DECK * num_decks)
+
+        shuffle(shoe)
+
+        if use_stop_card:
+            shoe.insert(randint(60, 75), STOP_BYTE)
+
+        top = len(shoe) - 1
+
+    def draw() -> int:
+        """
+        Draws a packed card from the shoe, the same way as Deck.draw_card
+
+        :return: The packed card
+        """
+
+        nonlocal top, insert_reached
+
+        if top < 0:  # shoe is empty
+            reset()
+
+        byte: int = shoe[top]
+        top -= 1
+
+        if byte == STOP_BYTE:  # remember to reshuffle after the round
+            insert_reached = True
+
+            byte: int = shoe[top]
+            top -= 1
+
+        return byte
+
+    reset()
+
+    round_results: List[int] = []
+
+    for _ in range(num_rounds):
+        if insert_reached:  # stop card was reached on previous round
+            reset()
+
+            insert_reached = False
+
+        hands: List[List[int]] = [[0, 0, 0, 0, 0, 0]]
+        house: List[int] = [0, 0, 0, 0, 0, 0]
+
+        _add(hands[0], draw())
+        _add(hands[0], draw())
+        _add(house, draw())  # face down
+        up_byte: int = draw()
+        _add(house, up_byte)
+        house_value: int = PACKED_VALUES[up_byte]
+
+        bets: List[int] = [bet]
+        results: List[Optional[int]] = [None]
+
+        house_natural: bool = house[SCORE] == 21
+        player_natural: bool = hands[0][SCORE] == 21
+
+        if player_natural and not house_natural:  # 1.5x win
+            results[0] = bet * 3 // 2
+
+        elif house_natural:  # lose, or tie with a natural
+            results[0] = 0 if player_natural else -bet
+
+        i: int = 0
+
+        while i < len(hands):
+            if results[i] is not None:  # hand is done being played
+                i += 1
+
+                continue
+
+            hand: List[int] = hands[i]
+
+            while True:
+                if one_hit_ace_split and hand[TIMES_SPLIT] == 1 and hand[FIRST_RANK] == 1:
+                    choice: str = 'h'  # player has to hit after splitting aces
+
+                    one_hit_ace: bool = True
+
+                else:
+                    one_hit_ace: bool = False
+
+                    first_rank: int = hand[FIRST_RANK]
+
+                    first_value: int = 11 if first_rank == 1 else min(first_rank, 10)
+
+                    if hand[NUM_CARDS] != 2 or not (max_splits is None or hand[TIMES_SPLIT] < max_splits):
+                        can_split: bool = False
+
+                    elif can_split_diff_tens and first_rank > 10:
+                        can_split: bool = hand[SECOND_RANK] >= 10  # face cards split with any 10-card
+
+                    else:
+                        can_split: bool = first_rank == hand[SECOND_RANK]
+
+                    can_double_down: bool = can_dd_after_split or hand[TIMES_SPLIT] == 0
+
+                    choice: str = choose_action(hand[NUM_CARDS], hand[SCORE], hand[SOFT_ACES] > 0, first_value,
+                                                house_value, can_double_down, can_split)
+
+                if choice == 's':  # stand
+                    break
+
+                elif choice == 'dd':  # double down
+                    bets[i] *= 2
+
+                elif choice == 'sp':  # split
+                    hand[TIMES_SPLIT] += 1
+
+                    # second card becomes a new hand, first card is played again on its own
+                    split_hand: List[int] = [0, 0, 0, 0, 0, hand[TIMES_SPLIT]]
+                    second_rank: int = hand[SECOND_RANK]
+
+                    _add(split_hand, second_rank << 2)
+                    hand[SCORE] = hand[SOFT_ACES] = hand[NUM_CARDS] = 0
+                    _add(hand, first_rank << 2)
+
+                    hands.insert(i + 1, split_hand)
+                    bets.insert(i + 1, bets[i])
+                    results.insert(i + 1, None)
+
+                    continue
+
+                _add(hand, draw())
+
+                if hand[SCORE] > 21:  # hand is busted: loss
+                    results[i] = -bets[i]
+
+                    break
+
+                if hand[SCORE] == 21:
+                    # split hand with a natural, house rules allow naturals after splits: 1.5x win
+                    if natural_after_split and hand[NUM_CARDS] == 2:
+                        results[i] = bets[i] * 3 // 2
+
+                    break
+
+                if choice == 'dd' or one_hit_ace:
+                    break  # doubling down or splitting aces allows only one hit
+
+            i += 1
+
+        # at least one player hand is under 21 (round is not over)
+        if None in results:
+            # while dealer score is under 17 (taking into account soft 17 rule, for two-card soft 17s)
+            while house[SCORE] < 17 or h17 and house[NUM_CARDS] == 2 and house[SCORE] == 17 and house[SOFT_ACES]:
+                _add(house, draw())
+
+            for i, hand in enumerate(hands):
+                if results[i] is None:
+                    if house[SCORE] > 21 or hand[SCORE] > house[SCORE]:  # win
+                        results[i] = bets[i]
+
+                    elif hand[SCORE] < house[SCORE]:  # loss
+                        results[i] = -bets[i]
+
+                    else:  # tie
+                        results[i] = 0
+
+        round_results.append(sum(results))
+
+    return round_results
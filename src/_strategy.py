@@ -0,0 +1,104 @@
+from typing import Dict, List
+
+from _card import Card
+from _hand import Hand
+
+# basic strategy for a multi-deck shoe where the house hits soft 17 and doubling down after splitting is allowed
+# each row is indexed by the value of the house's face-up card, 2-11 (A)
+# H=hit, S=stand, D=double down (otherwise hit), X=double down (otherwise stand)
+
+# house's face-up card:  2345678910A
+HARD_TABLE: Dict[int, str] = {4: 'HHHHHHHHHH',
+                              5: 'HHHHHHHHHH',
+                              6: 'HHHHHHHHHH',
+                              7: 'HHHHHHHHHH',
+                              8: 'HHHHHHHHHH',
+                              9: 'HDDDDHHHHH',
+                              10: 'DDDDDDDDHH',
+                              11: 'DDDDDDDDDD',
+                              12: 'HHSSSHHHHH',
+                              13: 'SSSSSHHHHH',
+                              14: 'SSSSSHHHHH',
+                              15: 'SSSSSHHHHH',
+                              16: 'SSSSSHHHHH',
+                              17: 'SSSSSSSSSS',
+                              18: 'SSSSSSSSSS',
+                              19: 'SSSSSSSSSS',
+                              20: 'SSSSSSSSSS',
+                              21: 'SSSSSSSSSS'}
+
+# house's face-up card:  2345678910A
+SOFT_TABLE: Dict[int, str] = {12: 'HHHHHHHHHH',
+                              13: 'HHHDDHHHHH',
+                              14: 'HHHDDHHHHH',
+                              15: 'HHDDDHHHHH',
+                              16: 'HHDDDHHHHH',
+                              17: 'HDDDDHHHHH',
+                              18: 'XXXXXSSHHH',
+                              19: 'SSSSXSSSSS',
+                              20: 'SSSSSSSSSS',
+                              21: 'SSSSSSSSSS'}
+
+# whether to split a pair, indexed by the value of the paired cards (Y=split, N=play as a total)
+# house's face-up card:  2345678910A
+PAIR_TABLE: Dict[int, str] = {2: 'YYYYYYNNNN',
+                              3: 'YYYYYYNNNN',
+                              4: 'NNNYYNNNNN',
+                              5: 'NNNNNNNNNN',
+                              6: 'YYYYYNNNNN',
+                              7: 'YYYYYYNNNN',
+                              8: 'YYYYYYYYYY',
+                              9: 'YYYYYNYYNN',
+                              10: 'NNNNNNNNNN',
+                              11: 'YYYYYYYYYY'}
+
+
+def choose_action(num_cards: int, score: int, is_soft: bool, first_value: int, house_value: int, can_double_down: bool, can_split: bool) -> str:
+    """
+    Looks up the basic strategy action for a hand described by plain numbers
+
+    :param num_cards: The number of cards in the hand
+    :param score: The score of the hand
+    :param is_soft: Whether the hand has an ace still counted as 11
+    :param first_value: The value of the first card in the hand (11 for an ace)
+    :param house_value: The value of the house's face-up card (11 for an ace)
+    :param can_double_down: Whether the player is allowed to double down
+    :param can_split: Whether the player is allowed to split
+    :return: The chosen action (one of h/s/dd/sp)
+    """
+
+    if num_cards < 2:
+        return 'h'  # hands that were just split always need another card
+
+    column: int = house_value - 2  # A is worth 11, so it is the last column
+
+    if can_split and PAIR_TABLE[first_value][column] == 'Y':
+        return 'sp'
+
+    if is_soft:
+        action: str = SOFT_TABLE[score][column]
+
+    else:
+        action: str = HARD_TABLE[score][column]
+
+    if action in ('D', 'X'):
+        if can_double_down:
+            return 'dd'
+
+        # double down isn't allowed, so fall back to hitting or standing
+        action: str = 'H' if action == 'D' else 'S'
+
+    return 'h' if action == 'H' else 's'
+
+
+def basic_strategy(hand: Hand, house_card: Card, choices: List[str]) -> str:
+    """
+    Chooses an action by looking it up in the basic strategy tables, for use as a policy with Blackjack.play_many
+
+    :param hand: The hand being played
+    :param house_card: The house's face-up card
+    :param choices: The possible choices (i.e. ['h', 's', 'dd'])
+    :return: The chosen action
+    """
+
+    return choose_action(len(hand), hand.score, hand.is_soft, hand[0].value, house_card.value, 'dd' in choices, 'sp' in choices)
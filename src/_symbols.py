@@ -1,19 +1,22 @@
-from typing import List
+from sys import intern
+from typing import Tuple
 
-RANK_SYMBOLS: List[str] = ['A',
-                           '2',
-                           '3',
-                           '4',
-                           '5',
-                           '6',
-                           '7',
-                           '8',
-                           '9',
-                           '10',
-                           'J',
-                           'Q',
-                           'K']
-SUIT_SYMBOLS: List[str] = ['♠',
-                           '♥',
-                           '♦',
-                           '♣']
+# lookup tables are read-only, symbols are interned so repeated lookups share one string
+RANK_SYMBOLS: Tuple[str, ...] = tuple(map(intern, ('A',
+                                                   '2',
+                                                   '3',
+                                                   '4',
+                                                   '5',
+                                                   '6',
+                                                   '7',
+                                                   '8',
+                                                   '9',
+                                                   '10',
+                                                   'J',
+                                                   'Q',
+                                                   'K')))
+SUIT_SYMBOLS: Tuple[str, ...] = tuple(map(intern, ('♠',
+                                                   '♥',
+                                                   '♦',
+                                                   '♣')))
+FLIPPED_SYMBOL: str = intern('🂠')
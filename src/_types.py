@@ -1 +1,2 @@
-Rank = Suit = int
+Rank = int
+Suit = int